@@ -1,18 +1,27 @@
 import os
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from urllib.parse import urlparse
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
 
-import requests
+import aiohttp
+import orjson
 from flask import Flask, render_template, request, redirect, url_for
 from flask import flash
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime
-from sqlalchemy.orm import sessionmaker, declarative_base
+from markupsafe import escape
+from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Date, Index, text, func
+from sqlalchemy.orm import sessionmaker, declarative_base, load_only, scoped_session
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from dotenv import load_dotenv
 
 from apscheduler.schedulers.background import BackgroundScheduler
 import pytz
+import atexit
 import smtplib
+import threading
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
@@ -42,6 +51,8 @@ app.secret_key = os.getenv("SECRET_KEY", "super-secret-key")  # change in prod
 # -------------------------------------------------
 Base = declarative_base()
 
+URL_MAX_LEN = 2048
+
 class PressArticle(Base):
     __tablename__ = "press_articles"
 
@@ -49,16 +60,65 @@ class PressArticle(Base):
     newspaper = Column(String(100))
     language = Column(String(20))
     title = Column(Text)
-    url = Column(Text, unique=True, index=True)
+    url = Column(String(URL_MAX_LEN), unique=True, index=True)
     snippet = Column(Text)
     query_used = Column(String(255))
-    publish_date = Column(Text)   # stored as raw text (e.g. 2024-12-01T10:00:00+05:30)
+    publish_date = Column(String(35))   # raw ISO8601 text (e.g. 2024-12-01T10:00:00+05:30)
+    publish_date_date = Column(Date, index=True)  # parsed date part, for fast filtering
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_articles_created_at", "created_at"),
+        Index("ix_articles_np_lang_pdd", "newspaper", "language", "publish_date_date"),
+    )
+
 # Create engine & session
-engine = create_engine(DATABASE_URL)
+# pool_pre_ping revalidates pooled connections so a dropped Postgres
+# connection doesn't surface as an error mid-request
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+)
 Base.metadata.create_all(engine)
-SessionLocal = sessionmaker(bind=engine)
+
+# create_all won't add new columns to an already-existing table,
+# so add publish_date_date explicitly and backfill it from the raw text
+with engine.begin() as _conn:
+    _conn.execute(text(
+        "ALTER TABLE press_articles ADD COLUMN IF NOT EXISTS publish_date_date DATE"
+    ))
+    # Backfill in Python with the same tolerance as the insert path: the
+    # regex accepts invalid calendar dates (e.g. 2024-02-31 from a bad
+    # metatag) which a SQL ::date cast would turn into a boot failure,
+    # so parse each value and skip the ones that don't make a real date
+    _pending = _conn.execute(text(
+        "SELECT id, substring(publish_date, 1, 10) AS day "
+        "FROM press_articles "
+        "WHERE publish_date_date IS NULL "
+        "AND publish_date ~ '^\\d{4}-\\d{2}-\\d{2}'"
+    )).all()
+    _params = []
+    for _row_id, _day in _pending:
+        try:
+            _params.append({"id": _row_id, "pd": date.fromisoformat(_day)})
+        except ValueError:
+            continue
+    if _params:
+        _conn.execute(
+            text("UPDATE press_articles SET publish_date_date = :pd WHERE id = :id"),
+            _params,
+        )
+    # Superseded by ix_articles_np_lang_pdd — the date filter now runs
+    # against publish_date_date, not the raw text column
+    _conn.execute(text("DROP INDEX IF EXISTS ix_articles_np_lang_pd"))
+
+# create_all won't add new indexes to an already-existing table,
+# so create them explicitly (no-op if they already exist)
+for _idx in PressArticle.__table__.indexes:
+    _idx.create(bind=engine, checkfirst=True)
+SessionLocal = scoped_session(sessionmaker(bind=engine))
 
 # -------------------------------------------------
 # Newspaper mapping & queries (from your script)
@@ -83,56 +143,116 @@ NEWS_MAP = {
 ENGLISH_QUERIES = ['"cargills"', '"cargils"']
 SINHALA_QUERIES = ['"කාගිල්ස්"', '"කාගීල්ස්"']
 
-SINHALA_DOMAINS = [
+SINHALA_DOMAINS = frozenset({
     "lankadeepa.lk",
     "mawbima.lk",
     "ada.lk",
     "aruna.lk",
     "divaina.lk",
     "dinamina.lk"
-]
+})
+
+# Static data used on every request — compute once at import time
+NEWSPAPERS_SORTED = tuple(sorted(set(NEWS_MAP.values())))
+
+# Precomputed domain -> (newspaper, language) lookup
+DOMAIN_META = {
+    k: (v, "Sinhala" if k in SINHALA_DOMAINS else "English")
+    for k, v in NEWS_MAP.items()
+}
+
+@lru_cache(maxsize=4096)
+def classify(url):
+    """Return (newspaper, language) for a URL, cached per URL."""
+    netloc = urlparse(url).netloc.removeprefix("www.")
+
+    # Fast path: every NEWS_MAP key is a full eTLD+1, so a plain dict
+    # hit covers the common case
+    meta = DOMAIN_META.get(netloc)
+    if meta is not None:
+        return meta
+
+    # Fallback for subdomains, e.g. sports.dailymirror.lk
+    for key, meta in DOMAIN_META.items():
+        if netloc.endswith("." + key):
+            return meta
+
+    return ("Unknown", "English")
 
 def get_newspaper_name(url):
-    domain = urlparse(url).netloc.replace("www.", "")
-    for key, name in NEWS_MAP.items():
-        if key in domain:
-            return name
-    return "Unknown"
+    return classify(url)[0]
 
 def get_language(url):
-    domain = urlparse(url).netloc.replace("www.", "")
-    for d in SINHALA_DOMAINS:
-        if d in domain:
-            return "Sinhala"
-    return "English"
-
-def google_search(query, site):
+    return classify(url)[1]
+
+# Transient CSE failures worth retrying (rate limit / server errors)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3  # seconds, doubled per attempt
+
+async def fetch_cse_page(session, params):
+    """GET one CSE page, retrying transient errors with backoff."""
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            async with session.get(GOOGLE_URL, params=params) as r:
+                if r.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                    await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
+                    continue
+                return orjson.loads(await r.read())
+        except aiohttp.ClientError:
+            if attempt == MAX_RETRIES:
+                raise
+            await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
+
+async def google_search(session, query, site):
     """Run a site-specific CSE query (up to 100 results)."""
-    results = []
-    start = 1
-
-    while True:
-        params = {
+    def page_params(start):
+        return {
             "q": f"{query} site:{site}",
             "key": API_KEY,
             "cx": CX,
             "start": start
         }
 
-        r = requests.get(GOOGLE_URL, params=params)
-        data = r.json()
+    # First page tells us how many results exist in total
+    data = await fetch_cse_page(session, page_params(1))
+    results = list(data.get("items", []))
 
-        if "items" not in data:
-            break
+    if len(results) < 10:
+        return results
 
-        results.extend(data["items"])
+    try:
+        total = int(data["queries"]["request"][0]["totalResults"])
+    except (KeyError, IndexError, TypeError, ValueError):
+        total = 100  # unknown — assume the CSE maximum
+
+    # CSE serves at most 100 results (last page starts at 91); fetch the
+    # remaining pages in parallel instead of waiting on each one before
+    # requesting the next
+    starts = range(11, min(total, 91) + 1, 10)
+    if starts:
+        pages = await asyncio.gather(
+            *(fetch_cse_page(session, page_params(s)) for s in starts)
+        )
+        for page in pages:
+            results.extend(page.get("items", []))
 
-        if len(data["items"]) < 10:
-            break
+    return results
 
-        start += 10
+async def scan_all_domains():
+    """Run every (domain, query) CSE search concurrently on one session."""
+    pairs = []
+    for domain in NEWS_MAP.keys():
+        queries = SINHALA_QUERIES if domain in SINHALA_DOMAINS else ENGLISH_QUERIES
+        for query in queries:
+            pairs.append((domain, query))
 
-    return results
+    connector = aiohttp.TCPConnector(limit=20, keepalive_timeout=60)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        tasks = [google_search(session, query, domain) for domain, query in pairs]
+        all_items = await asyncio.gather(*tasks)
+
+    return list(zip(pairs, all_items))
 
 def title_contains_keyword(title, keywords):
     if not title:
@@ -140,15 +260,59 @@ def title_contains_keyword(title, keywords):
     title_lower = title.lower()
     return any(k.lower().replace('"', '') in title_lower for k in keywords)
 
+def article_to_dict(a):
+    """Plain-dict view of an article row, usable after the session closes."""
+    return {
+        "newspaper": a.newspaper,
+        "language": a.language,
+        "title": a.title,
+        "url": a.url,
+        "publish_date": a.publish_date,
+    }
+
 # -------------------------------------------------
 # Email
 # -------------------------------------------------
-def send_email(articles, subject):
+_smtp = None
+# The cached connection is shared by the scan EXECUTOR threads and the
+# scheduler thread; hold this lock across get_smtp() + send_message()
+# so overlapping sends can't interleave commands on one socket
+_smtp_lock = threading.Lock()
+
+def get_smtp():
+    """Return a cached SMTP connection, reconnecting if it went stale.
+
+    Callers must hold _smtp_lock.
+    """
+    global _smtp
+
+    if _smtp is not None:
+        try:
+            _smtp.noop()
+            return _smtp
+        except Exception:
+            _smtp = None
+
+    _smtp = smtplib.SMTP_SSL("smtp.gmail.com", 465)
+    _smtp.login(EMAIL_USER, EMAIL_PASS)
+    return _smtp
+
+def _close_smtp():
+    with _smtp_lock:
+        if _smtp is not None:
+            try:
+                _smtp.quit()
+            except Exception:
+                pass
+
+atexit.register(_close_smtp)
+
+def send_email(articles, subject, summary_counts=None):
     if not EMAIL_USER or not EMAIL_PASS:
         print("Email credentials not configured, skipping email.")
         return
 
-    if not articles:
+    if not articles and not summary_counts:
         print("No articles to send in email.")
         return
 
@@ -157,26 +321,42 @@ def send_email(articles, subject):
     msg["From"] = EMAIL_USER
     msg["To"] = EMAIL_USER  # send to yourself as requested
 
-    # Build HTML body
-    html_rows = ""
-    for a in articles:
-        pub = a.publish_date or "Unknown"
-        html_rows += f"""
+    # Build HTML body in one join; title, publish_date and url are all
+    # scraped, so escape every one of them (escape() also quotes ", so
+    # the url is safe inside the href attribute).
+    # Articles are plain dicts, see article_to_dict()
+    html_rows = "".join(
+        f"""
         <tr>
-          <td>{a.newspaper}</td>
-          <td>{a.language}</td>
-          <td>{a.title}</td>
-          <td>{pub}</td>
-          <td><a href="{a.url}">{a.url}</a></td>
+          <td>{a["newspaper"]}</td>
+          <td>{a["language"]}</td>
+          <td>{escape(a["title"])}</td>
+          <td>{escape(a["publish_date"] or "Unknown")}</td>
+          <td><a href="{escape(a["url"])}">{escape(a["url"])}</a></td>
         </tr>
         """
+        for a in articles
+    )
 
-    html_body = f"""
-    <html>
-      <body>
-        <p>Hi Thejan,<br><br>
-           Here are the new Cargills-related articles.<br><br>
-        </p>
+    # Optional per-newspaper count summary ahead of the detail table
+    summary_html = ""
+    if summary_counts:
+        summary_rows = "".join(
+            f"<tr><td>{np}</td><td>{n}</td></tr>"
+            for np, n in sorted(summary_counts.items())
+        )
+        summary_html = f"""
+        <p>Articles by newspaper:</p>
+        <table border="1" cellpadding="5" cellspacing="0">
+          <tr><th>Newspaper</th><th>Articles</th></tr>
+          {summary_rows}
+        </table>
+        <br>
+        """
+
+    detail_html = ""
+    if articles:
+        detail_html = f"""
         <table border="1" cellpadding="5" cellspacing="0">
           <tr>
             <th>Newspaper</th>
@@ -187,6 +367,16 @@ def send_email(articles, subject):
           </tr>
           {html_rows}
         </table>
+        """
+
+    html_body = f"""
+    <html>
+      <body>
+        <p>Hi Thejan,<br><br>
+           Here are the new Cargills-related articles.<br><br>
+        </p>
+        {summary_html}
+        {detail_html}
         <br>
         <p>Press monitoring bot.</p>
       </body>
@@ -196,8 +386,8 @@ def send_email(articles, subject):
     msg.attach(MIMEText(html_body, "html"))
 
     try:
-        with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-            server.login(EMAIL_USER, EMAIL_PASS)
+        with _smtp_lock:
+            server = get_smtp()
             server.send_message(msg)
         print("Email sent successfully.")
     except Exception as e:
@@ -209,56 +399,92 @@ def send_email(articles, subject):
 def run_scan_and_save(send_email_immediate=False):
     session = SessionLocal()
     new_articles = []
+    rows = []
 
     try:
-        for domain in NEWS_MAP.keys():
-            print(f"Scanning {domain}...")
+        print(f"Scanning {len(NEWS_MAP)} domains concurrently...")
+        scan_results = asyncio.run(scan_all_domains())
+
+        # 1) Dedupe candidates by URL in memory before touching the DB —
+        # both Sinhala spellings (or both English ones) often hit the
+        # same article
+        candidates = {}
+        for (domain, query), items in scan_results:
+            print(f"  {domain} / {query}: {len(items)} results")
             queries = SINHALA_QUERIES if domain in SINHALA_DOMAINS else ENGLISH_QUERIES
 
-            for query in queries:
-                print(f"  Using query {query}")
-                items = google_search(query, domain)
-
-                for item in items:
-                    url = item.get("link", "")
-                    if not url:
-                        continue
-
-                    title = item.get("title", "")
-
-                    # 🔥 1) Filter: only save if title contains keyword
-                    if not title_contains_keyword(title, queries):
-                        continue
-
-                    # 2) Check if already in DB
-                    existing = session.query(PressArticle).filter_by(url=url).first()
-                    if existing:
-                        continue
-
-                    # 3) Extract publish date
-                    publish_date = (
-                        item.get("pagemap", {})
-                        .get("metatags", [{}])[0]
-                        .get("article:published_time", "Unknown")
-                    )
-
-                    # 4) Save to DB
-                    article = PressArticle(
-                        newspaper=get_newspaper_name(url),
-                        language=get_language(url),
-                        title=title,
-                        url=url,
-                        snippet=item.get("snippet"),
-                        query_used=query,
-                        publish_date=publish_date
-                    )
-
-                    session.add(article)
-                    new_articles.append(article)
-
-        # Commit inserts
+            for item in items:
+                url = item.get("link", "")
+                if not url:
+                    continue
+
+                # 🔥 Filter: only save if title contains keyword
+                if not title_contains_keyword(item.get("title", ""), queries):
+                    continue
+
+                candidates.setdefault(url, (item, query))
+
+        # 2) Preload known URLs once and diff against the candidates
+        existing_urls = {u for (u,) in session.query(PressArticle.url).all()}
+
+        for url in candidates.keys() - existing_urls:
+            # A URL past the column width would make the single bulk
+            # INSERT fail — and keep failing on every later scan since
+            # it never gets stored — so skip it outright
+            if len(url) > URL_MAX_LEN:
+                print(f"Skipping overlong URL ({len(url)} chars): {url[:80]}...")
+                continue
+
+            item, query = candidates[url]
+
+            # 3) Extract publish date (clamped to the column width —
+            # the metatag is scraped and occasionally malformed)
+            publish_date = (
+                item.get("pagemap", {})
+                .get("metatags", [{}])[0]
+                .get("article:published_time", "Unknown")
+            )[:35]
+
+            # Parse the date part once at insert time so the index
+            # view can filter on a real Date column
+            try:
+                publish_date_date = date.fromisoformat(publish_date[:10])
+            except ValueError:
+                publish_date_date = None
+
+            # 4) Collect row for one bulk insert after the loop
+            newspaper, language = classify(url)
+            rows.append({
+                "newspaper": newspaper,
+                "language": language,
+                "title": item.get("title", ""),
+                "url": url,
+                "snippet": item.get("snippet"),
+                "query_used": query,
+                "publish_date": publish_date,
+                "publish_date_date": publish_date_date,
+                "created_at": datetime.utcnow()
+            })
+
+        # Single multi-row INSERT; ON CONFLICT makes duplicates race-safe
+        if rows:
+            stmt = (
+                pg_insert(PressArticle.__table__)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["url"])
+            )
+            session.execute(stmt)
         session.commit()
 
+        if rows:
+            _invalidate_page1_cache()  # new rows must show up on refresh
+
+        # Return plain dicts rather than detached ORM objects
+        new_articles = [
+            {k: row[k] for k in ("newspaper", "language", "title", "url", "publish_date")}
+            for row in rows
+        ]
+
         if send_email_immediate and new_articles:
             send_email(new_articles, subject="Cargills Press Monitoring – Manual Trigger")
 
@@ -273,6 +499,9 @@ def run_scan_and_save(send_email_immediate=False):
 # -------------------------------------------------
 # Daily scheduled job at 10:00 AM Sri Lanka time
 # -------------------------------------------------
+# Skip the per-article table in the daily email beyond this many rows
+DAILY_DETAIL_LIMIT = 200
+
 def daily_job():
     # 1) Run scan once
     run_scan_and_save(send_email_immediate=False)
@@ -290,73 +519,148 @@ def daily_job():
         now_utc = datetime.utcnow()
         since_utc = now_utc - timedelta(days=1)
 
-        recent_articles = (
-            session.query(PressArticle)
+        # One aggregate query decides whether (and how big) the email is
+        counts = dict(
+            session.query(PressArticle.newspaper, func.count(PressArticle.id))
             .filter(PressArticle.created_at >= since_utc,
                     PressArticle.created_at <= now_utc)
-            .order_by(PressArticle.created_at.desc())
+            .group_by(PressArticle.newspaper)
             .all()
         )
+        total = sum(counts.values())
 
-        if recent_articles:
-            send_email(
-                recent_articles,
-                subject="Cargills Press Monitoring – Daily Report (Last 24 hours)"
-            )
-        else:
+        if not total:
             print("No new articles in last 24 hours; skipping daily email.")
+            return
+
+        # Fetch detail rows only while the report stays a readable size;
+        # past that, the per-newspaper summary carries the email
+        articles = []
+        if total <= DAILY_DETAIL_LIMIT:
+            recent_articles = (
+                session.query(PressArticle)
+                .filter(PressArticle.created_at >= since_utc,
+                        PressArticle.created_at <= now_utc)
+                .order_by(PressArticle.created_at.desc())
+                .all()
+            )
+            articles = [article_to_dict(a) for a in recent_articles]
+
+        send_email(
+            articles,
+            subject="Cargills Press Monitoring – Daily Report (Last 24 hours)",
+            summary_counts=counts
+        )
     finally:
         session.close()
 
 # Scheduler
 scheduler = BackgroundScheduler(timezone=TZ_NAME)
 scheduler.add_job(daily_job, "cron", hour=10, minute=0)  # 10:00 AM Sri Lanka time
-scheduler.start()
+# Under multi-worker gunicorn every worker imports this module; gate the
+# scheduler so only one process runs daily_job (set RUN_SCHEDULER=0 on
+# the extra workers, or =1 on a dedicated one)
+if os.getenv("RUN_SCHEDULER", "1") == "1":
+    scheduler.start()
 
 # -------------------------------------------------
 # Routes
 # -------------------------------------------------
+PER_PAGE = 50
+
+# Per-process cache for the unfiltered first page — the view every
+# redirect (and every post-scan reload) lands on
+_PAGE1_CACHE = {"at": 0.0, "data": None}
+PAGE1_TTL = 60  # seconds
+
+def _invalidate_page1_cache():
+    _PAGE1_CACHE["data"] = None
+
+# Columns the listing tables actually render; skips hydrating the
+# potentially large snippet Text column
+LIST_COLUMNS = load_only(
+    PressArticle.newspaper,
+    PressArticle.language,
+    PressArticle.title,
+    PressArticle.url,
+    PressArticle.publish_date,
+    PressArticle.created_at,
+)
+
 @app.route("/", methods=["GET"])
 def index():
-    session = SessionLocal()
-
     # Filters from query params
     language = request.args.get("language", "").strip()
     newspaper = request.args.get("newspaper", "").strip()
+    page = max(request.args.get("page", 1, type=int), 1)
 
     # NEW — which field to filter by
     date_type = request.args.get("date_type", "publish_date")
     start_date = request.args.get("start_date", "").strip()
     end_date = request.args.get("end_date", "").strip()
 
-    try:
-        query = session.query(PressArticle)
-
-        if language:
-            query = query.filter(PressArticle.language == language)
-        if newspaper:
-            query = query.filter(PressArticle.newspaper == newspaper)
-
-        # 🔥 HANDLE DATE RANGE FILTER
-        if start_date and end_date:
-            if date_type == "publish_date":
-                query = query.filter(
-                    PressArticle.publish_date >= start_date,
-                    PressArticle.publish_date <= end_date + "T99:99:99"
-                )
-            elif date_type == "created_at":
-                start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-                end_dt = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
-                query = query.filter(
-                    PressArticle.created_at >= start_dt,
-                    PressArticle.created_at < end_dt
-                )
-
-        articles = query.order_by(PressArticle.id.desc()).all()
-        languages = set(a.language for a in articles if a.language)
+    # The default view (no filters, first page) is served from a short
+    # TTL cache; scans invalidate it when they insert rows
+    is_default_view = page == 1 and not any([language, newspaper, start_date, end_date])
+    cached = _PAGE1_CACHE["data"]
+    if (is_default_view and cached is not None
+            and time.monotonic() - _PAGE1_CACHE["at"] < PAGE1_TTL):
+        total_articles, articles, languages = cached
+    else:
+        session = SessionLocal()
+        try:
+            query = session.query(PressArticle)
+
+            if language:
+                query = query.filter(PressArticle.language == language)
+            if newspaper:
+                query = query.filter(PressArticle.newspaper == newspaper)
+
+            # 🔥 HANDLE DATE RANGE FILTER (ignore malformed dates from
+            # the query string instead of raising a 500)
+            if start_date and end_date:
+                if date_type == "publish_date":
+                    try:
+                        start_d = date.fromisoformat(start_date)
+                        end_d = date.fromisoformat(end_date)
+                    except ValueError:
+                        flash("Invalid date range ignored.")
+                    else:
+                        query = query.filter(
+                            PressArticle.publish_date_date >= start_d,
+                            PressArticle.publish_date_date <= end_d
+                        )
+                elif date_type == "created_at":
+                    try:
+                        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+                        end_dt = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
+                    except ValueError:
+                        flash("Invalid date range ignored.")
+                    else:
+                        query = query.filter(
+                            PressArticle.created_at >= start_dt,
+                            PressArticle.created_at < end_dt
+                        )
+
+            total_articles = query.count()
+            articles = (
+                query.options(LIST_COLUMNS)
+                .order_by(PressArticle.id.desc())
+                .limit(PER_PAGE)
+                .offset((page - 1) * PER_PAGE)
+                .all()
+            )
+            languages = {
+                lang for (lang,) in session.query(PressArticle.language).distinct()
+                if lang
+            }
 
-    finally:
-        session.close()
+        finally:
+            session.close()
+
+        if is_default_view:
+            _PAGE1_CACHE["data"] = (total_articles, articles, languages)
+            _PAGE1_CACHE["at"] = time.monotonic()
 
     return render_template(
         "index.html",
@@ -369,43 +673,26 @@ def index():
             "start_date": start_date,
             "end_date": end_date
         },
-        newspapers_sorted=sorted(set(NEWS_MAP.values())),
+        newspapers_sorted=NEWSPAPERS_SORTED,
         languages=languages,
+        page=page,
+        has_next=page * PER_PAGE < total_articles,
+        total_articles=total_articles,
         pytz=pytz
     )
 
 
+# Executor for manual scans so the HTTP worker isn't blocked for the
+# duration of a full 14-domain scan
+EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
 @app.route("/run-scan", methods=["POST"])
 def run_scan():
-    # Run scan and get list of new articles
-    new_articles = run_scan_and_save(send_email_immediate=True)
-
-    # After scan, reload full list (no filters) for bottom section
-    session = SessionLocal()
-    try:
-        articles = (
-            session.query(PressArticle)
-            .order_by(PressArticle.created_at.desc())
-            .all()
-        )
-    finally:
-        session.close()
-
-    flash(f"Scan completed. {len(new_articles)} new articles found.")
-    return render_template(
-        "index.html",
-        new_articles=new_articles,
-        articles=articles,
-        filters={
-            "language": "",
-            "newspaper": "",
-            "date_type": "publish_date",
-            "start_date": "",
-            "end_date": ""
-        },
-        newspapers_sorted=sorted(set(NEWS_MAP.values())),
-        pytz=pytz
-    )
+    # Kick off the scan in the background and return immediately;
+    # results are emailed and show up in the listing on refresh
+    EXECUTOR.submit(run_scan_and_save, True)
+    flash("Scan started in the background. New articles will be emailed and appear here shortly.")
+    return redirect(url_for("index"))
 
 # -------------------------------------------------
 # Entry point